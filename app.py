@@ -13,13 +13,26 @@ import os
 import sys
 import argparse
 import asyncio
+import concurrent.futures
+import hashlib
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime
 from flask import Flask, render_template, jsonify, request
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to Flask's jsonify
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional: serve responses uncompressed
+    Compress = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -32,7 +45,8 @@ sys.path.append(str(Path(__file__).parent))
 
 # Import our utilities
 from utils.config import config
-from utils.database import DatabaseManager
+from utils.database import DatabaseManager, RESOURCE_SUMMARY_COLUMNS
+from utils.cache import TTLCache
 from discover.resource_discovery import get_discovery_engine
 
 # Initialize Flask app
@@ -40,9 +54,18 @@ app = Flask(__name__)
 app.secret_key = config.get('SECRET_KEY')
 CORS(app)
 
+# Compress large JSON responses (resource listings) when Flask-Compress is installed
+if Compress is not None:
+    Compress(app)
+
 # Initialize database
 db = DatabaseManager()
 
+# Short-lived caches for frequently polled endpoints: skills_cache holds
+# (ETag, payload), stats_cache holds stats tagged with their data version
+skills_cache = TTLCache(ttl=config.get('SKILLS_CACHE_TTL'))
+stats_cache = TTLCache(ttl=config.get('STATS_CACHE_TTL'))
+
 # Initialize resource discovery engine
 discovery_engine = None
 try:
@@ -54,6 +77,83 @@ try:
 except Exception as e:
     print(f"❌ Failed to initialize resource discovery engine: {e}")
 
+# Long-running event loop for discovery coroutines (Flask handlers are sync),
+# so each request doesn't pay for creating and tearing down its own loop
+discovery_loop = asyncio.new_event_loop()
+threading.Thread(target=discovery_loop.run_forever, name='discovery-loop', daemon=True).start()
+
+# Blocking API calls made by discovery run on a bounded pool, and at most
+# that many discoveries are admitted at once so bursts can't pile up work
+discovery_loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(
+    max_workers=config.get('DISCOVERY_WORKERS'),
+    thread_name_prefix='discovery'
+))
+discovery_slots = threading.BoundedSemaphore(config.get('DISCOVERY_WORKERS'))
+
+# In-flight discoveries keyed by (skill category, resource types), so
+# concurrent requests for the same skill wait on one run instead of racing.
+# The map is per process, so it only joins requests served by the same
+# threaded gunicorn worker
+inflight_discoveries = {}
+inflight_lock = threading.Lock()
+
+class DiscoveryBusyError(Exception):
+    """Raised to requests waiting on a discovery that was refused a slot"""
+
+def fast_jsonify(payload, status=200):
+    """Serialize large JSON payloads with orjson when available"""
+    if orjson is None:
+        response = jsonify(payload)
+        response.status_code = status
+        return response
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
+def data_etag(data_version=None):
+    """Build an ETag for the current request from the database version"""
+    if data_version is None:
+        data_version = db.get_data_version()
+    version = f"{data_version}:{request.full_path}"
+    return hashlib.md5(version.encode()).hexdigest()
+
+def not_modified_response(etag):
+    """Return a 304 response if the client already holds this ETag"""
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+def etag_response(payload, etag):
+    """Serialize a payload with ETag headers so clients can revalidate cheaply"""
+    response = fast_jsonify(payload)
+    # Weak, so Flask-Compress (1.19+) doesn't append the content encoding to it
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+def cached_etag_response(cache, key):
+    """Serve a cached (ETag, payload) entry, or None on a cache miss"""
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    
+    etag, payload = cached
+    return not_modified_response(etag) or etag_response(payload, etag)
+
+def cached_resource_stats(data_version):
+    """Get resource statistics, shared by the stats and browse endpoints
+    
+    Stats are cached against the database version their ETag was built from,
+    so a write from any worker process invalidates them on the next request.
+    """
+    cached = stats_cache.get('resource_stats')
+    if cached is not None and cached[0] == data_version:
+        return cached[1]
+    
+    stats = db.get_resource_stats()
+    stats_cache.set('resource_stats', (data_version, stats))
+    return stats
+
 @app.route('/')
 def index():
     """Main dashboard showing emerging skills and learning paths"""
@@ -74,6 +174,15 @@ def api_status():
 def api_emerging_skills():
     """Get emerging skills from database"""
     try:
+        cached = cached_etag_response(skills_cache, 'emerging_skills')
+        if cached:
+            return cached
+        
+        etag = data_etag()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+        
         # Get emerging skills from database
         skills = db.get_emerging_skills(limit=20)
         
@@ -124,110 +233,210 @@ def api_emerging_skills():
             
             # Retrieve the newly added skills
             skills = db.get_emerging_skills(limit=20)
+            etag = data_etag()
         
-        return jsonify({
+        payload = {
             "emerging_skills": skills,
             "total_count": len(skills),
             "last_updated": datetime.now().isoformat(),
             "source": "ai_horizon_ed_database"
-        })
+        }
+        skills_cache.set('emerging_skills', (etag, payload))
+        return etag_response(payload, etag)
         
     except Exception as e:
-        logger.error(f"Error retrieving emerging skills: {e}")
+        logger.error("Error retrieving emerging skills: %s", e)
         return jsonify({"error": "Failed to retrieve emerging skills"}), 500
 
+def group_resources_by_type(resources):
+    """Group resources by resource type for API responses"""
+    grouped_resources = {}
+    for resource in resources:
+        res_type = resource['resource_type']
+        if res_type not in grouped_resources:
+            grouped_resources[res_type] = []
+        grouped_resources[res_type].append(resource)
+    return grouped_resources
+
+# Stored resource type for each discovery search type
+DISCOVERY_RESOURCE_TYPES = {
+    'youtube_videos': 'youtube_video',
+    'online_courses': 'online_course',
+    'documentation': 'documentation',
+    'tools': 'tool',
+    'books': 'book'
+}
+
+def find_stored_resources(skill_category, resource_types):
+    """Get recently discovered resources of the requested types, or None if too few are stored"""
+    stored_types = list(dict.fromkeys(DISCOVERY_RESOURCE_TYPES.get(resource_type) for resource_type in resource_types))
+    if None in stored_types:
+        # "all" and unknown types have no stored type to check
+        return None
+    
+    # Each type needs DISCOVERY_CACHE_THRESHOLD resources stored within the
+    # last DISCOVERY_CACHE_TTL seconds; the capped COUNT stops at the threshold
+    threshold = config.get('DISCOVERY_CACHE_THRESHOLD')
+    max_age = config.get('DISCOVERY_CACHE_TTL')
+    for stored_type in stored_types:
+        stored_count = db.count_resources(
+            skill_category=skill_category,
+            resource_type=stored_type,
+            created_within=max_age,
+            limit=threshold
+        )
+        if stored_count < threshold:
+            return None
+    
+    # Split the response limit evenly across the requested types
+    per_type_limit = max(config.get('DISCOVERY_CACHE_LIMIT') // len(stored_types), 1)
+    resources = []
+    for stored_type in stored_types:
+        resources.extend(db.search_resources(
+            skill_category=skill_category,
+            resource_type=stored_type,
+            created_within=max_age,
+            limit=per_type_limit,
+            columns=RESOURCE_SUMMARY_COLUMNS
+        ))
+    return resources or None
+
+def discover_and_store_resources(skill, skill_category, resource_types):
+    """Run discovery for a skill and store the results, linking them to the skill"""
+    # Run discovery on the shared background loop (since Flask isn't async)
+    future = asyncio.run_coroutine_threadsafe(
+        discovery_engine.discover_resources_for_skill(skill, resource_types),
+        discovery_loop
+    )
+    try:
+        resources = future.result(timeout=config.get('DISCOVERY_TIMEOUT'))
+    except Exception:
+        future.cancel()
+        raise
+    
+    # Map discovered resources to database format
+    db_resources = []
+    for resource_data in resources:
+        db_resources.append({
+            'title': resource_data['title'],
+            'description': resource_data['description'],
+            'url': resource_data['url'],
+            'resource_type': resource_data['resource_type'],
+            'skill_category': skill_category,
+            'learning_level': 'intermediate',  # Default level
+            'duration_minutes': resource_data.get('duration_minutes', 0),
+            'quality_score': resource_data['quality_score'],
+            'author': resource_data.get('author', ''),
+            'source': resource_data.get('source_platform', ''),
+            'keywords': resource_data.get('keywords', [])
+        })
+    
+    # Store discovered resources in database in a single transaction
+    resource_ids = db.add_resources_bulk(db_resources)
+    stored_resources = [resource_id for resource_id in resource_ids if resource_id is not None]
+    if stored_resources:
+        stats_cache.clear()
+    
+    # Link stored resources to the skill if we have a skill record
+    if stored_resources:
+        matching_skill = db.get_emerging_skill_by_name(skill)
+        if matching_skill:
+            db.link_skills_to_resources_bulk([
+                (matching_skill['id'], resource_id, resource_data['quality_score'], resource_data['resource_type'])
+                for resource_data, resource_id in zip(resources, resource_ids)
+                if resource_id is not None
+            ])
+    
+    return resources, stored_resources
+
+def discovery_busy_response():
+    """Ask the client to retry once a discovery slot frees up"""
+    response = jsonify({
+        "error": "Too many discoveries in progress",
+        "message": "Please retry shortly"
+    })
+    response.status_code = 503
+    response.headers['Retry-After'] = '30'
+    return response
+
 @app.route('/api/discover/<skill>')
 def api_discover_resources(skill):
     """Discover educational resources for a specific skill"""
     try:
-        if not discovery_engine:
-            return jsonify({
-                "error": "Resource discovery engine not available",
-                "message": "Please configure Perplexity API key to enable resource discovery"
-            }), 503
-        
         # Get resource types from query parameters
         resource_types = request.args.getlist('types')
         if not resource_types:
             resource_types = ["youtube_videos", "online_courses", "documentation", "tools"]
         
-        # Run discovery in a new event loop (since Flask isn't async)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Serve previously discovered resources instead of running discovery
+        # when every requested type has enough recent ones stored
+        skill_category = skill.lower().replace(' ', '_')
+        cached_resources = find_stored_resources(skill_category, resource_types)
+        if cached_resources is not None:
+            discovered_at = max(resource['created_at'] for resource in cached_resources)
+            return jsonify({
+                "skill": skill,
+                "resources": group_resources_by_type(cached_resources),
+                "total_resources": len(cached_resources),
+                "stored_resources": 0,
+                "cached": True,
+                "joined_in_progress": False,
+                "discovery_timestamp": datetime.fromisoformat(discovered_at).isoformat(),
+                "resource_types_searched": resource_types
+            })
         
-        try:
-            resources = loop.run_until_complete(
-                discovery_engine.discover_resources_for_skill(skill, resource_types)
-            )
-        finally:
-            loop.close()
+        if not discovery_engine:
+            return jsonify({
+                "error": "Resource discovery engine not available",
+                "message": "Please configure Perplexity API key to enable resource discovery"
+            }), 503
         
-        # Store discovered resources in database
-        skill_id = None
-        stored_resources = []
+        # Concurrent requests for the same discovery share one run
+        flight_key = (skill_category, tuple(resource_types))
+        with inflight_lock:
+            flight = inflight_discoveries.get(flight_key)
+            is_leader = flight is None
+            if is_leader:
+                flight = concurrent.futures.Future()
+                inflight_discoveries[flight_key] = flight
         
-        for resource_data in resources:
+        if is_leader:
+            if not discovery_slots.acquire(blocking=False):
+                with inflight_lock:
+                    inflight_discoveries.pop(flight_key, None)
+                flight.set_exception(DiscoveryBusyError())
+                return discovery_busy_response()
+            
             try:
-                # Map to database format
-                db_resource = {
-                    'title': resource_data['title'],
-                    'description': resource_data['description'],
-                    'url': resource_data['url'],
-                    'resource_type': resource_data['resource_type'],
-                    'skill_category': skill.lower().replace(' ', '_'),
-                    'learning_level': 'intermediate',  # Default level
-                    'duration_minutes': resource_data.get('duration_minutes', 0),
-                    'quality_score': resource_data['quality_score'],
-                    'author': resource_data.get('author', ''),
-                    'source': resource_data.get('source_platform', ''),
-                    'keywords': resource_data.get('keywords', [])
-                }
-                
-                # Add to database
-                resource_id = db.add_resource(db_resource)
-                stored_resources.append(resource_id)
-                
-                # Link to skill if we have a skill record
-                if skill_id is None:
-                    # Try to find or create skill record
-                    skills = db.get_emerging_skills()
-                    matching_skill = next(
-                        (s for s in skills if s['skill_name'].lower() == skill.lower()), 
-                        None
-                    )
-                    if matching_skill:
-                        skill_id = matching_skill['id']
-                
-                if skill_id:
-                    db.link_skill_to_resource(
-                        skill_id, 
-                        resource_id, 
-                        resource_data['quality_score'],
-                        resource_data['resource_type']
-                    )
-                    
+                resources, stored_resources = discover_and_store_resources(skill, skill_category, resource_types)
+                flight.set_result((resources, stored_resources))
             except Exception as e:
-                logger.warning(f"Failed to store resource {resource_data['title']}: {e}")
-        
-        # Group resources by type for response
-        grouped_resources = {}
-        for resource in resources:
-            res_type = resource['resource_type']
-            if res_type not in grouped_resources:
-                grouped_resources[res_type] = []
-            grouped_resources[res_type].append(resource)
+                flight.set_exception(e)
+                raise
+            finally:
+                discovery_slots.release()
+                with inflight_lock:
+                    inflight_discoveries.pop(flight_key, None)
+        else:
+            logger.info("Joining in-progress discovery for %s", skill)
+            try:
+                resources, stored_resources = flight.result(timeout=config.get('DISCOVERY_TIMEOUT'))
+            except DiscoveryBusyError:
+                return discovery_busy_response()
         
         return jsonify({
             "skill": skill,
-            "resources": grouped_resources,
+            "resources": group_resources_by_type(resources),
             "total_resources": len(resources),
             "stored_resources": len(stored_resources),
+            "cached": False,
+            "joined_in_progress": not is_leader,
             "discovery_timestamp": datetime.now().isoformat(),
             "resource_types_searched": resource_types
         })
         
     except Exception as e:
-        logger.error(f"Error discovering resources for {skill}: {e}")
+        logger.error("Error discovering resources for %s: %s", skill, e)
         return jsonify({
             "error": "Resource discovery failed",
             "skill": skill,
@@ -238,13 +447,23 @@ def api_discover_resources(skill):
 def api_browse_database():
     """Browse all stored resources with filtering options"""
     try:
-        # Get query parameters
+        # Get query parameters, rejecting malformed numbers before touching the database
         query = request.args.get('search', '')
         skill_category = request.args.get('category', '')
         resource_type = request.args.get('type', '')
         learning_level = request.args.get('level', '')
-        min_quality = float(request.args.get('min_quality', '0.0'))
-        limit = int(request.args.get('limit', '100'))
+        try:
+            min_quality = float(request.args.get('min_quality', '0.0'))
+            limit = min(max(int(request.args.get('limit', '100')), 1), config.get('MAX_BROWSE_LIMIT'))
+            offset = max(int(request.args.get('offset', '0')), 0)
+        except ValueError:
+            return jsonify({"error": "min_quality, limit and offset must be numbers"}), 400
+        
+        data_version = db.get_data_version()
+        etag = data_etag(data_version)
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
         
         # Search resources
         resources = db.search_resources(
@@ -253,15 +472,21 @@ def api_browse_database():
             resource_type=resource_type if resource_type else None,
             learning_level=learning_level if learning_level else None,
             min_quality=min_quality,
-            limit=limit
+            limit=limit,
+            offset=offset
         )
         
         # Get database stats
-        stats = db.get_resource_stats()
+        stats = cached_resource_stats(data_version)
         
-        return jsonify({
+        return etag_response({
             "resources": resources,
             "total_found": len(resources),
+            "pagination": {
+                "limit": limit,
+                "offset": offset,
+                "next_offset": offset + limit if len(resources) == limit else None
+            },
             "database_stats": stats,
             "filters_applied": {
                 "search": query,
@@ -270,74 +495,65 @@ def api_browse_database():
                 "level": learning_level,
                 "min_quality": min_quality
             }
-        })
+        }, etag)
         
     except Exception as e:
-        logger.error(f"Error browsing database: {e}")
+        logger.error("Error browsing database: %s", e)
         return jsonify({"error": "Failed to browse database"}), 500
 
 @app.route('/api/database/stats')
 def api_database_stats():
     """Get database statistics"""
     try:
-        stats = db.get_resource_stats()
+        data_version = db.get_data_version()
+        etag = data_etag(data_version)
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
         
-        # Get emerging skills count
-        skills = db.get_emerging_skills()
-        stats['emerging_skills_count'] = len(skills)
+        cached = stats_cache.get('database_stats')
+        if cached is not None and cached[0] == data_version:
+            return etag_response(cached[1], etag)
         
-        # Get resources by category
-        all_resources = db.search_resources(limit=1000)
-        by_category = {}
-        by_type = {}
-        by_quality = {"high": 0, "medium": 0, "low": 0}
+        stats = dict(cached_resource_stats(data_version))
         
-        for resource in all_resources:
-            # Count by category
-            category = resource['skill_category']
-            by_category[category] = by_category.get(category, 0) + 1
-            
-            # Count by type
-            res_type = resource['resource_type']
-            by_type[res_type] = by_type.get(res_type, 0) + 1
-            
-            # Count by quality
-            quality = resource['quality_score']
-            if quality >= 0.8:
-                by_quality["high"] += 1
-            elif quality >= 0.5:
-                by_quality["medium"] += 1
-            else:
-                by_quality["low"] += 1
+        # Count skills in SQL rather than fetching (and capping) the skill list
+        stats['emerging_skills_count'] = db.count_emerging_skills()
         
-        stats['resources_by_category'] = by_category
-        stats['resources_by_type'] = by_type
-        stats['resources_by_quality'] = by_quality
+        # Breakdowns are aggregated in SQL rather than over fetched rows
+        stats['resources_by_category'] = stats['by_category']
+        stats['resources_by_type'] = stats['by_type']
+        stats['resources_by_quality'] = db.get_quality_breakdown()
         
-        return jsonify(stats)
+        stats_cache.set('database_stats', (data_version, stats))
+        return etag_response(stats, etag)
         
     except Exception as e:
-        logger.error(f"Error getting database stats: {e}")
+        logger.error("Error getting database stats: %s", e)
         return jsonify({"error": "Failed to get database statistics"}), 500
 
 @app.route('/api/database/skill-resources/<int:skill_id>')
 def api_skill_resources(skill_id):
     """Get all resources for a specific skill"""
     try:
+        etag = data_etag()
+        not_modified = not_modified_response(etag)
+        if not_modified:
+            return not_modified
+        
         resources = db.get_resources_for_skill(skill_id)
         
         # Get skill info
-        skills = db.get_emerging_skills()
-        skill_info = next((s for s in skills if s['id'] == skill_id), None)
+        skill_info = db.get_emerging_skill_by_id(skill_id)
         
-        return jsonify({
+        return etag_response({
             "skill": skill_info,
             "resources": resources,
             "total_resources": len(resources)
-        })
+        }, etag)
         
     except Exception as e:
-        logger.error(f"Error getting skill resources: {e}")
+        logger.error("Error getting skill resources: %s", e)
         return jsonify({"error": "Failed to get skill resources"}), 500
 
 @app.route('/database')
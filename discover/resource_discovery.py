@@ -5,6 +5,8 @@ Uses Perplexity API to search for educational resources and AI to score content
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import re
@@ -12,15 +14,79 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the standard json module
+    orjson = None
+
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.config import config
+from utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Patterns used to parse search responses, compiled once at import
+JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"{}|\\^`\[\].,;:!?]')
+TITLE_PATTERNS = [
+    re.compile(r'"([^"]+)"'),
+    re.compile(r'([A-Z][a-zA-Z\s]+)')
+]
+
+# Maximum number of resources taken from a regex-parsed response
+MAX_REGEX_RESOURCES = 10
+
+# Enhanced prompts based on real AI-cybersecurity workforce analysis
+AI_NEW_SKILLS = (
+    "prompt engineering", "ai security engineering", "mlsecops", 
+    "ai governance", "ai security architecture"
+)
+
+AI_AUGMENTED_SKILLS = (
+    "ai-enhanced", "ai-augmented", "threat intelligence", 
+    "penetration testing", "threat hunting", "security research", "security analysis"
+)
+
+# Resource type aliases mapped to standard categories
+RESOURCE_TYPE_MAPPING = {
+    'youtube_video': 'youtube_video',
+    'video': 'youtube_video',
+    'online_course': 'online_course', 
+    'course': 'online_course',
+    'documentation': 'documentation',
+    'docs': 'documentation',
+    'tool': 'tool',
+    'software': 'tool',
+    'book': 'book',
+    'ebook': 'book',
+    'article': 'article',
+    'tutorial': 'tutorial'
+}
+
+# Basic scoring weights by platform credibility and resource type
+PLATFORM_CREDIBILITY_SCORES = {
+    'youtube': 0.7,
+    'coursera': 0.9,
+    'edx': 0.9, 
+    'udemy': 0.8,
+    'github': 0.8,
+    'documentation': 0.9
+}
+
+RESOURCE_TYPE_SCORES = {
+    'online_course': 0.9,
+    'tutorial': 0.8,
+    'documentation': 0.8,
+    'youtube_video': 0.7,
+    'tool': 0.8,
+    'article': 0.6
+}
+
 @dataclass
 class DiscoveredResource:
     """Data class for a discovered educational resource"""
@@ -44,6 +110,12 @@ class PerplexitySearcher:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        
+        # Shared session keeps TLS connections to the API alive across searches,
+        # with a pool sized for the discovery executor's concurrent calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=config.get('DISCOVERY_WORKERS')))
     
     async def search_educational_content(self, skill: str, resource_type: str = "all") -> List[DiscoveredResource]:
         """Search for educational content for a specific skill"""
@@ -51,13 +123,18 @@ class PerplexitySearcher:
         # Craft search prompts based on resource type
         search_prompts = self._generate_search_prompts(skill, resource_type)
         
+        # Prompts are independent API calls, so run them concurrently
+        results = await asyncio.gather(
+            *(self._execute_search(prompt, skill, resource_type) for prompt in search_prompts),
+            return_exceptions=True
+        )
+        
         all_resources = []
-        for prompt in search_prompts:
-            try:
-                resources = await self._execute_search(prompt, skill, resource_type)
-                all_resources.extend(resources)
-            except Exception as e:
-                logger.error(f"Search failed for prompt '{prompt}': {e}")
+        for prompt, resources in zip(search_prompts, results):
+            if isinstance(resources, Exception):
+                logger.error(f"Search failed for prompt '{prompt}': {resources}")
+                continue
+            all_resources.extend(resources)
         
         # Deduplicate based on URL
         seen_urls = set()
@@ -72,20 +149,9 @@ class PerplexitySearcher:
     def _generate_search_prompts(self, skill: str, resource_type: str) -> List[str]:
         """Generate targeted search prompts based on AI workforce intelligence"""
         
-        # Enhanced prompts based on real AI-cybersecurity workforce analysis
-        ai_new_skills = [
-            "prompt engineering", "ai security engineering", "mlsecops", 
-            "ai governance", "ai security architecture"
-        ]
-        
-        ai_augmented_skills = [
-            "ai-enhanced", "ai-augmented", "threat intelligence", 
-            "penetration testing", "threat hunting", "security research", "security analysis"
-        ]
-        
         skill_lower = skill.lower()
-        is_ai_new = any(ai_skill in skill_lower for ai_skill in ai_new_skills)
-        is_ai_augmented = any(aug_skill in skill_lower for aug_skill in ai_augmented_skills)
+        is_ai_new = any(ai_skill in skill_lower for ai_skill in AI_NEW_SKILLS)
+        is_ai_augmented = any(aug_skill in skill_lower for aug_skill in AI_AUGMENTED_SKILLS)
         
         if is_ai_new:
             # Prompts for entirely new AI-cybersecurity roles
@@ -215,7 +281,11 @@ Focus on recent, high-quality resources with good educational value.
         }
         
         try:
-            response = requests.post(self.base_url, headers=self.headers, json=payload, timeout=30)
+            # requests is blocking, so run it on the event loop's executor
+            response = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(self.session.post, self.base_url, json=payload, timeout=30)
+            )
             response.raise_for_status()
             
             result = response.json()
@@ -227,15 +297,22 @@ Focus on recent, high-quality resources with good educational value.
             logger.error(f"Perplexity API error: {e}")
             return []
     
+    def _load_json(self, text: str) -> Any:
+        """Parse JSON text, using orjson when available"""
+        if orjson is None:
+            return json.loads(text)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(text)
+    
     def _parse_search_results(self, content: str, skill: str) -> List[DiscoveredResource]:
         """Parse Perplexity response into DiscoveredResource objects"""
         resources = []
         
         try:
             # Try to extract JSON from the response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            json_match = JSON_OBJECT_PATTERN.search(content)
             if json_match:
-                data = json.loads(json_match.group())
+                data = self._load_json(json_match.group())
                 
                 for item in data.get('resources', []):
                     try:
@@ -266,22 +343,7 @@ Focus on recent, high-quality resources with good educational value.
     
     def _normalize_resource_type(self, resource_type: str) -> str:
         """Normalize resource type to standard categories"""
-        type_mapping = {
-            'youtube_video': 'youtube_video',
-            'video': 'youtube_video',
-            'online_course': 'online_course', 
-            'course': 'online_course',
-            'documentation': 'documentation',
-            'docs': 'documentation',
-            'tool': 'tool',
-            'software': 'tool',
-            'book': 'book',
-            'ebook': 'book',
-            'article': 'article',
-            'tutorial': 'tutorial'
-        }
-        
-        return type_mapping.get(resource_type.lower(), 'article')
+        return RESOURCE_TYPE_MAPPING.get(resource_type.lower(), 'article')
     
     def _extract_platform(self, url: str) -> str:
         """Extract platform name from URL"""
@@ -314,25 +376,23 @@ Focus on recent, high-quality resources with good educational value.
         resources = []
         
         # Look for URL patterns
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"{}|\\^`\[\].,;:!?]'
-        urls = re.findall(url_pattern, content)
+        urls = URL_PATTERN.findall(content)
         
         # Try to extract titles near URLs
         for url in urls:
+            if len(resources) >= MAX_REGEX_RESOURCES:
+                break
+            
             try:
                 # Look for text before the URL that might be a title
                 url_index = content.find(url)
                 if url_index > 0:
                     preceding_text = content[max(0, url_index-200):url_index]
                     # Extract potential title (look for quoted text or capitalized phrases)
-                    title_patterns = [
-                        r'"([^"]+)"',
-                        r'([A-Z][a-zA-Z\s]+)',
-                        r'([^\n.!?]+)(?=\s*' + re.escape(url) + ')'
-                    ]
+                    url_title_pattern = r'([^\n.!?]+)(?=\s*' + re.escape(url) + ')'
                     
                     title = "Educational Resource"
-                    for pattern in title_patterns:
+                    for pattern in (*TITLE_PATTERNS, url_title_pattern):
                         matches = re.findall(pattern, preceding_text)
                         if matches:
                             title = matches[-1].strip()
@@ -352,7 +412,7 @@ Focus on recent, high-quality resources with good educational value.
             except Exception as e:
                 logger.warning(f"Failed to parse URL {url}: {e}")
         
-        return resources[:10]  # Limit to 10 resources from regex parsing
+        return resources
     
     def _guess_type_from_url(self, url: str) -> str:
         """Guess resource type from URL"""
@@ -374,19 +434,35 @@ class ContentScorer:
     def __init__(self, ai_api_key: str, ai_provider: str = "anthropic"):
         self.ai_api_key = ai_api_key
         self.ai_provider = ai_provider
+        # AI scores keyed by prompt, so re-discovered resources aren't re-scored
+        self._score_cache = TTLCache(ttl=config.get('SCORE_CACHE_TTL'), maxsize=config.get('SCORE_CACHE_SIZE'))
+        self._client = None
+    
+    def _get_client(self):
+        """Get the provider SDK client, importing and creating it on first use"""
+        if self._client is None:
+            if self.ai_provider == "anthropic":
+                import anthropic
+                self._client = anthropic.Anthropic(api_key=self.ai_api_key)
+            else:
+                import openai
+                self._client = openai.OpenAI(api_key=self.ai_api_key)
+        return self._client
     
     async def score_resources(self, resources: List[DiscoveredResource], skill: str) -> List[Tuple[DiscoveredResource, float]]:
         """Score a list of resources for educational quality"""
-        scored_resources = []
+        scores = await asyncio.gather(
+            *(self._score_single_resource(resource, skill) for resource in resources),
+            return_exceptions=True
+        )
         
-        for resource in resources:
-            try:
-                score = await self._score_single_resource(resource, skill)
-                scored_resources.append((resource, score))
-            except Exception as e:
-                logger.error(f"Failed to score resource {resource.title}: {e}")
+        scored_resources = []
+        for resource, score in zip(resources, scores):
+            if isinstance(score, Exception):
+                logger.error(f"Failed to score resource {resource.title}: {score}")
                 # Assign default score if scoring fails
-                scored_resources.append((resource, 0.5))
+                score = 0.5
+            scored_resources.append((resource, score))
         
         return scored_resources
     
@@ -424,27 +500,43 @@ Consider:
 - Does it offer hands-on learning opportunities?
 """
         
-        if self.ai_provider == "anthropic":
-            return await self._score_with_anthropic(scoring_prompt)
-        elif self.ai_provider == "openai":
-            return await self._score_with_openai(scoring_prompt)
-        else:
+        if self.ai_provider not in ("anthropic", "openai"):
             # Default scoring algorithm
             return self._basic_scoring(resource, skill)
+        
+        cache_key = hashlib.sha256(f"{self.ai_provider}:{scoring_prompt}".encode()).hexdigest()
+        cached_score = self._score_cache.get(cache_key)
+        if cached_score is not None:
+            return cached_score
+        
+        if self.ai_provider == "anthropic":
+            score = await self._score_with_anthropic(scoring_prompt)
+        else:
+            score = await self._score_with_openai(scoring_prompt)
+        
+        # Failed calls fall back to a neutral score and are retried next time
+        if score is None:
+            return 0.5
+        
+        self._score_cache.set(cache_key, score)
+        return score
     
-    async def _score_with_anthropic(self, prompt: str) -> float:
-        """Score using Anthropic/Claude API"""
+    async def _score_with_anthropic(self, prompt: str) -> Optional[float]:
+        """Score using Anthropic/Claude API, or None if the call fails"""
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=self.ai_api_key)
+            client = self._get_client()
             
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=10,
-                temperature=0.1,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+            response = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    client.messages.create,
+                    model="claude-3-haiku-20240307",
+                    max_tokens=10,
+                    temperature=0.1,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                )
             )
             
             score_text = response.content[0].text.strip()
@@ -452,21 +544,24 @@ Consider:
             
         except Exception as e:
             logger.error(f"Anthropic scoring error: {e}")
-            return 0.5
+            return None
     
-    async def _score_with_openai(self, prompt: str) -> float:
-        """Score using OpenAI API"""
+    async def _score_with_openai(self, prompt: str) -> Optional[float]:
+        """Score using OpenAI API, or None if the call fails"""
         try:
-            import openai
-            client = openai.OpenAI(api_key=self.ai_api_key)
+            client = self._get_client()
             
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=10,
-                temperature=0.1
+            response = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    client.chat.completions.create,
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=10,
+                    temperature=0.1
+                )
             )
             
             score_text = response.choices[0].message.content.strip()
@@ -474,22 +569,14 @@ Consider:
             
         except Exception as e:
             logger.error(f"OpenAI scoring error: {e}")
-            return 0.5
+            return None
     
     def _basic_scoring(self, resource: DiscoveredResource, skill: str) -> float:
         """Basic scoring algorithm when AI APIs are unavailable"""
         score = 0.5  # Base score
         
         # Platform credibility
-        credible_platforms = {
-            'youtube': 0.7,
-            'coursera': 0.9,
-            'edx': 0.9, 
-            'udemy': 0.8,
-            'github': 0.8,
-            'documentation': 0.9
-        }
-        platform_score = credible_platforms.get(resource.source_platform, 0.5)
+        platform_score = PLATFORM_CREDIBILITY_SCORES.get(resource.source_platform, 0.5)
         
         # Title relevance (simple keyword matching)
         skill_words = skill.lower().split()
@@ -497,15 +584,7 @@ Consider:
         relevance = len([w for w in skill_words if any(w in tw for tw in title_words)]) / len(skill_words)
         
         # Resource type preference
-        type_scores = {
-            'online_course': 0.9,
-            'tutorial': 0.8,
-            'documentation': 0.8,
-            'youtube_video': 0.7,
-            'tool': 0.8,
-            'article': 0.6
-        }
-        type_score = type_scores.get(resource.resource_type, 0.5)
+        type_score = RESOURCE_TYPE_SCORES.get(resource.resource_type, 0.5)
         
         # Combine scores
         final_score = (platform_score * 0.4) + (relevance * 0.3) + (type_score * 0.3)
@@ -533,16 +612,19 @@ class ResourceDiscoveryEngine:
         
         logger.info(f"Starting resource discovery for skill: {skill}")
         
-        all_resources = []
+        # Search for each resource type concurrently
+        results = await asyncio.gather(
+            *(self.searcher.search_educational_content(skill, resource_type) for resource_type in resource_types),
+            return_exceptions=True
+        )
         
-        # Search for each resource type
-        for resource_type in resource_types:
-            try:
-                resources = await self.searcher.search_educational_content(skill, resource_type)
-                logger.info(f"Found {len(resources)} {resource_type} resources for {skill}")
-                all_resources.extend(resources)
-            except Exception as e:
-                logger.error(f"Failed to search for {resource_type}: {e}")
+        all_resources = []
+        for resource_type, resources in zip(resource_types, results):
+            if isinstance(resources, Exception):
+                logger.error(f"Failed to search for {resource_type}: {resources}")
+                continue
+            logger.info(f"Found {len(resources)} {resource_type} resources for {skill}")
+            all_resources.extend(resources)
         
         # Score resources if AI API is available
         if self.scorer and all_resources:
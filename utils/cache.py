@@ -0,0 +1,47 @@
+"""
+In-memory caching for AI-Horizon Educational Resources System
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after a fixed time-to-live"""
+
+    def __init__(self, ttl: float, maxsize: Optional[int] = None):
+        """Initialize cache with a time-to-live in seconds and optional entry limit"""
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached value by key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value until the TTL elapses"""
+        with self._lock:
+            # Re-insert so entries stay in expiry order
+            if self._entries.pop(key, None) is None and self.maxsize is not None and len(self._entries) >= self.maxsize:
+                self._evict()
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def _evict(self) -> None:
+        """Drop the oldest entry; expired entries are purged lazily by get"""
+        del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Drop all cached values"""
+        with self._lock:
+            self._entries.clear()
@@ -26,7 +26,13 @@ class Config:
             
             # Search Configuration
             'MAX_SEARCH_RESULTS': int(os.getenv('MAX_SEARCH_RESULTS', '50')),
+            'MAX_BROWSE_LIMIT': int(os.getenv('MAX_BROWSE_LIMIT', '500')),
             'SEARCH_TIMEOUT': int(os.getenv('SEARCH_TIMEOUT', '30')),
+            'DISCOVERY_TIMEOUT': int(os.getenv('DISCOVERY_TIMEOUT', '50')),
+            'DISCOVERY_WORKERS': int(os.getenv('DISCOVERY_WORKERS', '8')),
+            'DISCOVERY_CACHE_THRESHOLD': int(os.getenv('DISCOVERY_CACHE_THRESHOLD', '3')),
+            'DISCOVERY_CACHE_LIMIT': int(os.getenv('DISCOVERY_CACHE_LIMIT', '12')),
+            'DISCOVERY_CACHE_TTL': int(os.getenv('DISCOVERY_CACHE_TTL', '604800')),
             'MIN_CONTENT_QUALITY': float(os.getenv('MIN_CONTENT_QUALITY', '0.7')),
             
             # Resource Types
@@ -64,6 +70,12 @@ class Config:
                 'ai_tools'
             ],
             
+            # Response Caching (seconds)
+            'SKILLS_CACHE_TTL': int(os.getenv('SKILLS_CACHE_TTL', '60')),
+            'STATS_CACHE_TTL': int(os.getenv('STATS_CACHE_TTL', '30')),
+            'SCORE_CACHE_TTL': int(os.getenv('SCORE_CACHE_TTL', '86400')),
+            'SCORE_CACHE_SIZE': int(os.getenv('SCORE_CACHE_SIZE', '10000')),
+            
             # Rate Limiting
             'RATE_LIMIT_REQUESTS': int(os.getenv('RATE_LIMIT_REQUESTS', '100')),
             'RATE_LIMIT_WINDOW': int(os.getenv('RATE_LIMIT_WINDOW', '3600')),
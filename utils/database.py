@@ -4,6 +4,7 @@ Database management for AI-Horizon Educational Resources System
 
 import sqlite3
 import json
+import threading
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
@@ -13,6 +14,39 @@ from .config import config
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on a locked database before raising
+SQLITE_BUSY_TIMEOUT = 30
+
+# Prepared statements kept per connection
+SQLITE_CACHED_STATEMENTS = 256
+
+# Rows per executemany batch / IN (...) lookup
+BULK_BATCH_SIZE = 500
+
+INSERT_RESOURCE_SQL = '''
+    INSERT INTO educational_resources 
+    (title, description, url, resource_type, skill_category, learning_level,
+     duration_minutes, language, quality_score, popularity_score, metadata,
+     keywords, author, source, rating, review_count, prerequisites, learning_outcomes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Bulk inserts skip URLs stored concurrently by another discovery instead of
+# failing the whole batch on the UNIQUE constraint
+INSERT_RESOURCE_IF_ABSENT_SQL = INSERT_RESOURCE_SQL + ' ON CONFLICT(url) DO NOTHING'
+
+# Columns needed to display a resource summary, named as the dashboard reads them
+RESOURCE_SUMMARY_COLUMNS = [
+    'id', 'title', 'description', 'url', 'resource_type', 'quality_score',
+    'author', 'source AS source_platform', 'duration_minutes', 'created_at'
+]
+
+LINK_SKILL_RESOURCE_SQL = '''
+    INSERT OR REPLACE INTO skill_resource_mapping
+    (skill_id, resource_id, relevance_score, resource_type_for_skill)
+    VALUES (?, ?, ?, ?)
+'''
+
 class DatabaseManager:
     """Database manager for educational resources system"""
     
@@ -25,6 +59,7 @@ class DatabaseManager:
                 db_path = db_path[10:]
         
         self.db_path = db_path
+        self._local = threading.local()
         self._ensure_data_directory()
         self._initialize_database()
     
@@ -33,11 +68,34 @@ class DatabaseManager:
         data_dir = Path(self.db_path).parent
         data_dir.mkdir(parents=True, exist_ok=True)
     
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, tuned for concurrent reads alongside discovery writes
+        
+        Connections are kept per thread so sqlite3's prepared statement cache
+        is reused across calls instead of re-parsing SQL on every query.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=SQLITE_BUSY_TIMEOUT,
+                cached_statements=SQLITE_CACHED_STATEMENTS
+            )
+            # Durable at WAL checkpoints; skips an fsync on every commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        
+        conn.row_factory = None
+        return conn
+    
     def _initialize_database(self):
         """Initialize database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
+            # Write-ahead logging lets API reads proceed while discovery writes
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Educational Resources table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS educational_resources (
@@ -187,103 +245,249 @@ class DatabaseManager:
             ''')
 
             # Create indexes for better performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_resources_category ON educational_resources(skill_category)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_resources_level ON educational_resources(learning_level)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_resources_type ON educational_resources(resource_type)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_resources_quality ON educational_resources(quality_score)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_progress_user ON user_progress(user_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_search_user ON search_history(user_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_emerging_skills_urgency ON emerging_skills(urgency_score)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_emerging_skills_name_lower ON emerging_skills(LOWER(skill_name))')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_skill_mapping ON skill_resource_mapping(skill_id, resource_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_resources_category_quality ON educational_resources(skill_category, quality_score)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_resources_level_quality ON educational_resources(learning_level, quality_score)')
+            # idx_resources_category_quality also serves lookups by category alone
+            cursor.execute('DROP INDEX IF EXISTS idx_resources_category')
             
             conn.commit()
             logger.info("Educational resources database initialized successfully")
     
+    def _resource_from_row(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a resource row to a dictionary, parsing JSON fields"""
+        resource = dict(row)
+        # Rows may be projected to a subset of columns
+        if 'metadata' in resource:
+            resource['metadata'] = json.loads(resource['metadata'] or '{}')
+        if 'prerequisites' in resource:
+            resource['prerequisites'] = json.loads(resource['prerequisites'] or '[]')
+        if 'learning_outcomes' in resource:
+            resource['learning_outcomes'] = json.loads(resource['learning_outcomes'] or '[]')
+        if 'keywords' in resource:
+            resource['keywords'] = [k.strip() for k in resource['keywords'].split(',') if k.strip()]
+        return resource
+    
+    def _skill_from_row(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert an emerging skill row to a dictionary, parsing JSON fields"""
+        skill = dict(row)
+        skill['job_market_data'] = json.loads(skill['job_market_data'] or '{}')
+        skill['related_skills'] = json.loads(skill['related_skills'] or '[]')
+        return skill
+    
+    def _resource_params(self, resource_data: Dict[str, Any]) -> Tuple:
+        """Build the INSERT parameters for an educational resource"""
+        return (
+            resource_data['title'],
+            resource_data.get('description', ''),
+            resource_data['url'],
+            resource_data['resource_type'],
+            resource_data['skill_category'],
+            resource_data['learning_level'],
+            resource_data.get('duration_minutes', 0),
+            resource_data.get('language', 'en'),
+            resource_data.get('quality_score', 0.0),
+            resource_data.get('popularity_score', 0.0),
+            json.dumps(resource_data.get('metadata', {})),
+            ','.join(resource_data.get('keywords', [])),
+            resource_data.get('author', ''),
+            resource_data.get('source', ''),
+            resource_data.get('rating', 0.0),
+            resource_data.get('review_count', 0),
+            json.dumps(resource_data.get('prerequisites', [])),
+            json.dumps(resource_data.get('learning_outcomes', []))
+        )
+    
     def add_resource(self, resource_data: Dict[str, Any]) -> int:
         """Add a new educational resource"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
-            
-            # Prepare data
-            metadata = json.dumps(resource_data.get('metadata', {}))
-            prerequisites = json.dumps(resource_data.get('prerequisites', []))
-            learning_outcomes = json.dumps(resource_data.get('learning_outcomes', []))
-            keywords = ','.join(resource_data.get('keywords', []))
-            
-            cursor.execute('''
-                INSERT INTO educational_resources 
-                (title, description, url, resource_type, skill_category, learning_level,
-                 duration_minutes, language, quality_score, popularity_score, metadata,
-                 keywords, author, source, rating, review_count, prerequisites, learning_outcomes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                resource_data['title'],
-                resource_data.get('description', ''),
-                resource_data['url'],
-                resource_data['resource_type'],
-                resource_data['skill_category'],
-                resource_data['learning_level'],
-                resource_data.get('duration_minutes', 0),
-                resource_data.get('language', 'en'),
-                resource_data.get('quality_score', 0.0),
-                resource_data.get('popularity_score', 0.0),
-                metadata,
-                keywords,
-                resource_data.get('author', ''),
-                resource_data.get('source', ''),
-                resource_data.get('rating', 0.0),
-                resource_data.get('review_count', 0),
-                prerequisites,
-                learning_outcomes
-            ))
+            cursor.execute(INSERT_RESOURCE_SQL, self._resource_params(resource_data))
             
             resource_id = cursor.lastrowid
             conn.commit()
             logger.info(f"Added educational resource: {resource_data['title']} (ID: {resource_id})")
             return resource_id
     
+    def _get_resource_ids_by_url(self, cursor: sqlite3.Cursor, urls: List[str]) -> Dict[str, int]:
+        """Map stored resource URLs to their IDs, querying in batches"""
+        ids_by_url = {}
+        for start in range(0, len(urls), BULK_BATCH_SIZE):
+            batch = urls[start:start + BULK_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            cursor.execute(
+                f"SELECT url, id FROM educational_resources WHERE url IN ({placeholders})",
+                batch
+            )
+            ids_by_url.update(cursor.fetchall())
+        return ids_by_url
+    
+    def add_resources_bulk(self, resources_data: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """Add several educational resources using batched inserts
+        
+        Returns the new ID for each resource in order, or None for resources
+        that were not stored (e.g. duplicate URL). A URL stored concurrently
+        by another writer resolves to that writer's row.
+        """
+        resource_ids = [None] * len(resources_data)
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            
+            # Skip URLs that are already stored or repeated within the batch
+            seen_urls = set(self._get_resource_ids_by_url(cursor, [r['url'] for r in resources_data]))
+            new_positions = []
+            for position, resource_data in enumerate(resources_data):
+                if resource_data['url'] in seen_urls:
+                    logger.debug("Skipping duplicate resource %s: %s", resource_data['title'], resource_data['url'])
+                    continue
+                seen_urls.add(resource_data['url'])
+                new_positions.append(position)
+            
+            for start in range(0, len(new_positions), BULK_BATCH_SIZE):
+                batch = [resources_data[position] for position in new_positions[start:start + BULK_BATCH_SIZE]]
+                try:
+                    cursor.executemany(INSERT_RESOURCE_IF_ABSENT_SQL, [self._resource_params(r) for r in batch])
+                except sqlite3.Error as e:
+                    # Retry row by row so one bad resource doesn't drop the whole batch
+                    logger.warning("Batch insert failed, retrying individually: %s", e)
+                    conn.rollback()
+                    for resource_data in batch:
+                        try:
+                            cursor.execute(INSERT_RESOURCE_IF_ABSENT_SQL, self._resource_params(resource_data))
+                        except sqlite3.Error as e:
+                            logger.warning("Failed to store resource %s: %s", resource_data['title'], e)
+                conn.commit()
+            
+            ids_by_url = self._get_resource_ids_by_url(
+                cursor, [resources_data[position]['url'] for position in new_positions]
+            )
+            for position in new_positions:
+                resource_ids[position] = ids_by_url.get(resources_data[position]['url'])
+            
+            # Refresh query planner statistics after the bulk load when needed
+            cursor.execute("PRAGMA optimize")
+        
+        # One summary line per batch instead of a line per resource
+        stored_count = sum(1 for resource_id in resource_ids if resource_id is not None)
+        logger.info(
+            "Added %d of %d educational resources (%d duplicates skipped)",
+            stored_count, len(resources_data), len(resources_data) - len(new_positions)
+        )
+        return resource_ids
+    
+    def _build_resource_filters(self,
+                                query: Optional[str] = None,
+                                skill_category: Optional[str] = None,
+                                learning_level: Optional[str] = None,
+                                resource_type: Optional[str] = None,
+                                min_quality: float = 0.0,
+                                created_within: Optional[int] = None) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause and parameters for resource queries"""
+        where_conditions = ["quality_score >= ?"]
+        params = [min_quality]
+        
+        if query:
+            where_conditions.append("(title LIKE ? OR description LIKE ? OR keywords LIKE ?)")
+            query_param = f"%{query}%"
+            params.extend([query_param, query_param, query_param])
+        
+        if skill_category:
+            where_conditions.append("skill_category = ?")
+            params.append(skill_category)
+        
+        if learning_level:
+            where_conditions.append("learning_level = ?")
+            params.append(learning_level)
+        
+        if resource_type:
+            where_conditions.append("resource_type = ?")
+            params.append(resource_type)
+        
+        if created_within is not None:
+            where_conditions.append("created_at >= datetime('now', ?)")
+            params.append(f"-{created_within} seconds")
+        
+        return " AND ".join(where_conditions), params
+    
+    def count_resources(self,
+                        query: Optional[str] = None,
+                        skill_category: Optional[str] = None,
+                        resource_type: Optional[str] = None,
+                        created_within: Optional[int] = None,
+                        limit: Optional[int] = None) -> int:
+        """Count educational resources matching the filters
+        
+        When limit is given, counting stops once that many rows have matched,
+        which is all a threshold check needs. created_within only counts
+        resources stored in the last that many seconds.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            
+            where_clause, params = self._build_resource_filters(
+                query=query,
+                skill_category=skill_category,
+                resource_type=resource_type,
+                created_within=created_within
+            )
+            
+            if limit is None:
+                sql = f"SELECT COUNT(*) FROM educational_resources WHERE {where_clause}"
+            else:
+                sql = f'''
+                    SELECT COUNT(*) FROM (
+                        SELECT 1 FROM educational_resources WHERE {where_clause} LIMIT ?
+                    )
+                '''
+                params.append(limit)
+            
+            cursor.execute(sql, params)
+            return cursor.fetchone()[0]
+    
     def search_resources(self, 
                         query: Optional[str] = None,
                         skill_category: Optional[str] = None,
                         learning_level: Optional[str] = None,
                         resource_type: Optional[str] = None,
                         min_quality: float = 0.0,
-                        limit: int = 50) -> List[Dict[str, Any]]:
-        """Search for educational resources"""
-        with sqlite3.connect(self.db_path) as conn:
+                        limit: int = 50,
+                        columns: Optional[List[str]] = None,
+                        offset: int = 0,
+                        created_within: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Search for educational resources
+        
+        columns optionally restricts the selected columns, so callers that
+        only render a summary don't load the larger JSON fields.
+        """
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
-            # Build query
-            where_conditions = ["quality_score >= ?"]
-            params = [min_quality]
-            
-            if query:
-                where_conditions.append("(title LIKE ? OR description LIKE ? OR keywords LIKE ?)")
-                query_param = f"%{query}%"
-                params.extend([query_param, query_param, query_param])
-            
-            if skill_category:
-                where_conditions.append("skill_category = ?")
-                params.append(skill_category)
-            
-            if learning_level:
-                where_conditions.append("learning_level = ?")
-                params.append(learning_level)
-            
-            if resource_type:
-                where_conditions.append("resource_type = ?")
-                params.append(resource_type)
+            where_clause, params = self._build_resource_filters(
+                query=query,
+                skill_category=skill_category,
+                learning_level=learning_level,
+                resource_type=resource_type,
+                min_quality=min_quality,
+                created_within=created_within
+            )
             
-            where_clause = " AND ".join(where_conditions)
+            select_list = ', '.join(columns) if columns else '*'
             
             sql = f'''
-                SELECT * FROM educational_resources 
+                SELECT {select_list} FROM educational_resources 
                 WHERE {where_clause}
-                ORDER BY quality_score DESC, popularity_score DESC, created_at DESC
-                LIMIT ?
+                ORDER BY quality_score DESC, popularity_score DESC, created_at DESC, id DESC
+                LIMIT ? OFFSET ?
             '''
-            params.append(limit)
+            params.extend([limit, offset])
             
             cursor.execute(sql, params)
             rows = cursor.fetchall()
@@ -291,27 +495,23 @@ class DatabaseManager:
             # Convert to list of dictionaries
             resources = []
             for row in rows:
-                resource = dict(row)
-                # Parse JSON fields
-                resource['metadata'] = json.loads(resource['metadata'] or '{}')
-                resource['prerequisites'] = json.loads(resource['prerequisites'] or '[]')
-                resource['learning_outcomes'] = json.loads(resource['learning_outcomes'] or '[]')
-                resource['keywords'] = [k.strip() for k in resource['keywords'].split(',') if k.strip()]
-                resources.append(resource)
+                resources.append(self._resource_from_row(row))
             
             return resources
     
     def get_resource_by_id(self, resource_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific resource by ID"""
-        resources = self.search_resources()
-        for resource in resources:
-            if resource['id'] == resource_id:
-                return resource
-        return None
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT * FROM educational_resources WHERE id = ?", (resource_id,))
+            row = cursor.fetchone()
+            return self._resource_from_row(row) if row else None
     
     def update_user_preferences(self, user_id: str, preferences: Dict[str, Any]) -> None:
         """Update user preferences"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Convert lists to JSON
@@ -340,32 +540,35 @@ class DatabaseManager:
     
     def get_resource_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
-            # Total resources
-            cursor.execute("SELECT COUNT(*) FROM educational_resources")
-            total_resources = cursor.fetchone()[0]
-            
-            # Resources by category
+            # Totals and both breakdowns in one round-trip
             cursor.execute('''
-                SELECT skill_category, COUNT(*) as count 
+                SELECT 'total', NULL, COUNT(*), AVG(quality_score)
+                FROM educational_resources
+                UNION ALL
+                SELECT 'category', skill_category, COUNT(*), NULL
                 FROM educational_resources 
                 GROUP BY skill_category
-            ''')
-            by_category = dict(cursor.fetchall())
-            
-            # Resources by type
-            cursor.execute('''
-                SELECT resource_type, COUNT(*) as count 
+                UNION ALL
+                SELECT 'type', resource_type, COUNT(*), NULL
                 FROM educational_resources 
                 GROUP BY resource_type
             ''')
-            by_type = dict(cursor.fetchall())
             
-            # Average quality score
-            cursor.execute("SELECT AVG(quality_score) FROM educational_resources")
-            avg_quality = cursor.fetchone()[0] or 0.0
+            total_resources = 0
+            avg_quality = 0.0
+            by_category = {}
+            by_type = {}
+            for kind, key, count, average in cursor.fetchall():
+                if kind == 'total':
+                    total_resources = count
+                    avg_quality = average or 0.0
+                elif kind == 'category':
+                    by_category[key] = count
+                else:
+                    by_type[key] = count
             
             return {
                 'total_resources': total_resources,
@@ -374,9 +577,43 @@ class DatabaseManager:
                 'average_quality': round(avg_quality, 2)
             }
     
+    def get_data_version(self) -> str:
+        """Get a cheap fingerprint that changes whenever resources or skills change"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM educational_resources),
+                    (SELECT MAX(id) FROM educational_resources),
+                    (SELECT COUNT(*) FROM emerging_skills),
+                    (SELECT MAX(id) FROM emerging_skills),
+                    (SELECT MAX(last_updated) FROM emerging_skills),
+                    (SELECT MAX(id) FROM skill_resource_mapping)
+            ''')
+            return ':'.join(str(value) for value in cursor.fetchone())
+    
+    def get_quality_breakdown(self) -> Dict[str, int]:
+        """Count resources in the high/medium/low quality tiers"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT
+                    SUM(CASE WHEN quality_score >= 0.8 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN quality_score >= 0.5 AND quality_score < 0.8 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN quality_score >= 0.5 THEN 0 ELSE 1 END)
+                FROM educational_resources
+            ''')
+            high, medium, low = cursor.fetchone()
+            
+            return {
+                'high': high or 0,
+                'medium': medium or 0,
+                'low': low or 0
+            }
+    
     def log_search(self, user_id: Optional[str], search_params: Dict[str, Any], results_count: int) -> None:
         """Log search activity for analytics"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             filters_applied = json.dumps({
@@ -403,7 +640,7 @@ class DatabaseManager:
     
     def add_emerging_skill(self, skill_data: Dict[str, Any]) -> int:
         """Add a new emerging skill"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Prepare JSON data
@@ -434,7 +671,7 @@ class DatabaseManager:
     
     def get_emerging_skills(self, limit: int = 50, urgency_threshold: float = 0.0) -> List[Dict[str, Any]]:
         """Get emerging skills ordered by urgency"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -448,16 +685,43 @@ class DatabaseManager:
             rows = cursor.fetchall()
             skills = []
             for row in rows:
-                skill = dict(row)
-                skill['job_market_data'] = json.loads(skill['job_market_data'] or '{}')
-                skill['related_skills'] = json.loads(skill['related_skills'] or '[]')
-                skills.append(skill)
+                skills.append(self._skill_from_row(row))
             
             return skills
     
+    def count_emerging_skills(self) -> int:
+        """Count all emerging skills"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM emerging_skills")
+            return cursor.fetchone()[0]
+    
+    def get_emerging_skill_by_id(self, skill_id: int) -> Optional[Dict[str, Any]]:
+        """Get a specific emerging skill by ID"""
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT * FROM emerging_skills WHERE id = ?", (skill_id,))
+            row = cursor.fetchone()
+            return self._skill_from_row(row) if row else None
+    
+    def get_emerging_skill_by_name(self, skill_name: str) -> Optional[Dict[str, Any]]:
+        """Get an emerging skill by case-insensitive name"""
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            cursor.execute(
+                "SELECT * FROM emerging_skills WHERE LOWER(skill_name) = LOWER(?) LIMIT 1",
+                (skill_name,)
+            )
+            row = cursor.fetchone()
+            return self._skill_from_row(row) if row else None
+    
     def update_skill_discovery_status(self, skill_id: int, status: str) -> None:
         """Update resource discovery status for a skill"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 UPDATE emerging_skills 
@@ -469,18 +733,28 @@ class DatabaseManager:
     def link_skill_to_resource(self, skill_id: int, resource_id: int, relevance_score: float, 
                               resource_type_for_skill: str = 'general') -> None:
         """Link an emerging skill to an educational resource"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO skill_resource_mapping
-                (skill_id, resource_id, relevance_score, resource_type_for_skill)
-                VALUES (?, ?, ?, ?)
-            ''', (skill_id, resource_id, relevance_score, resource_type_for_skill))
+            cursor.execute(LINK_SKILL_RESOURCE_SQL,
+                           (skill_id, resource_id, relevance_score, resource_type_for_skill))
+            conn.commit()
+    
+    def link_skills_to_resources_bulk(self, links: List[Tuple[int, int, float, str]]) -> None:
+        """Link skills to resources in a single transaction
+        
+        Each link is a (skill_id, resource_id, relevance_score, resource_type_for_skill) tuple.
+        """
+        if not links:
+            return
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(LINK_SKILL_RESOURCE_SQL, links)
             conn.commit()
     
     def get_resources_for_skill(self, skill_id: int) -> List[Dict[str, Any]]:
         """Get all resources linked to a specific skill"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -495,12 +769,7 @@ class DatabaseManager:
             rows = cursor.fetchall()
             resources = []
             for row in rows:
-                resource = dict(row)
-                resource['metadata'] = json.loads(resource['metadata'] or '{}')
-                resource['prerequisites'] = json.loads(resource['prerequisites'] or '[]')
-                resource['learning_outcomes'] = json.loads(resource['learning_outcomes'] or '[]')
-                resource['keywords'] = [k.strip() for k in resource['keywords'].split(',') if k.strip()]
-                resources.append(resource)
+                resources.append(self._resource_from_row(row))
             
             return resources
 